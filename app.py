@@ -1,6 +1,20 @@
-from fastapi import Depends, FastAPI, HTTPException, Query
-from pydantic import ConfigDict, EmailStr, HttpUrl, TypeAdapter
-from sqlalchemy import JSON, Column, String, TypeDecorator
+import os
+from contextlib import asynccontextmanager
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+import anyio
+import msgspec
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, EmailStr, HttpUrl, TypeAdapter
+from pydantic_core import Url
+from sqlalchemy import JSON, Column, Index, String, TypeDecorator, event, update
+from sqlalchemy.orm import raiseload, selectinload, sessionmaker
 from sqlmodel import Field, Relationship, Session, SQLModel, create_engine, select
 from typing import Dict, Optional, List
 
@@ -10,11 +24,17 @@ class HttpUrlType(TypeDecorator):
     cache_ok = True
     python_type = HttpUrl
 
-    def process_bind_param(self, value, dialect) -> str:
+    def process_bind_param(self, value, dialect) -> str | None:
+        if value is None:
+            return None
         return str(value)
 
-    def process_result_value(self, value, dialect) -> HttpUrl:
-        return HttpUrl(url=value)
+    def process_result_value(self, value, dialect) -> HttpUrl | None:
+        if value is None:
+            return None
+        # stored values were validated as HttpUrl on the way in, so build the
+        # Url directly rather than going through the Annotated HttpUrl alias
+        return Url(value)
 
     def process_literal_param(self, value, dialect) -> str:
         return str(value)
@@ -47,6 +67,34 @@ class SchedulePublic(ScheduleBase):
     id: int
 
 
+class SchedulePublicStruct(msgspec.Struct):
+    url: Url
+    title: str
+    venue: str
+    venue_url: Url | None
+    schedule_datetime: str
+    locations: Dict
+    registration: Dict | None
+    description: str | None
+    id: int
+
+
+class ScheduleSummary(SQLModel):
+    url: HttpUrl
+    title: str
+    venue: str
+    schedule_datetime: str
+    id: int
+
+
+class ScheduleSummaryStruct(msgspec.Struct):
+    url: Url
+    title: str
+    venue: str
+    schedule_datetime: str
+    id: int
+
+
 class ScheduleUpdate(ScheduleBase):
 
     url:HttpUrl | None = None
@@ -70,10 +118,12 @@ class SectionBase(SQLModel):
 class Section(SectionBase, table=True):
     id: int | None = Field(default=None, primary_key=True)
 
-    events: List["Event"] = Relationship(back_populates="section")
+    events: List["Event"] = Relationship(
+        back_populates="section", sa_relationship_kwargs={"order_by": "Event.event_date"}
+    )
     schedule: Schedule | None = Relationship(back_populates="sections")
 
-    schedule_id: int | None = Field(default=None, foreign_key="schedule.id")
+    schedule_id: int | None = Field(default=None, foreign_key="schedule.id", index=True)
 
 
 class SectionCreate(SectionBase):
@@ -84,6 +134,13 @@ class SectionPublic(SectionBase):
     id: int
 
 
+class SectionPublicStruct(msgspec.Struct):
+    title: str
+    sequence: str
+    status: str | None
+    id: int
+
+
 class SectionUpdate(SQLModel):
     id: int | None = None
     title: str | None = None
@@ -105,6 +162,10 @@ class EventBase(SQLModel):
 
 
 class Event(EventBase, table=True):
+    # serves both the section_id foreign key lookups and a section's events
+    # in date order, so section_id needs no index of its own
+    __table_args__ = (Index("ix_event_section_date", "section_id", "event_date"),)
+
     id: int | None = Field(default=None, primary_key=True)
 
     section: Section | None = Relationship(back_populates="events")
@@ -114,6 +175,15 @@ class EventPublic(EventBase):
     id: int
 
 
+class EventPublicStruct(msgspec.Struct):
+    start_time: datetime.time
+    end_time: datetime.time
+    event_date: datetime.date
+    location: str
+    section_id: int | None
+    id: int
+
+
 class EventCreate(EventBase):
     pass
 
@@ -129,6 +199,10 @@ class EventPublicWithSection(EventPublic):
     section: SectionPublic | None = None
 
 
+class EventPublicWithSectionStruct(EventPublicStruct):
+    section: SectionPublicStruct | None
+
+
 class SectionPublicWithEventes(SectionPublic):
     eventes: List[EventPublic] = []
 
@@ -154,6 +228,17 @@ class VenuePublic(VenueBase):
     id: int
 
 
+class VenuePublicStruct(msgspec.Struct):
+    name: str
+    Tel: str | None
+    Address: str | None
+    Mail: str | None
+    url: Url | None
+    Fax: str | None
+    Contact: str | None
+    id: int
+
+
 class VenueCreate(VenueBase):
     pass
 
@@ -172,42 +257,225 @@ class VenueUpdate(VenueBase):
     Contact: Optional[str]  | None = None
 
 
+# columns behind each *Public shape, in field order, for the read endpoints
+# that select plain rows instead of loading ORM instances
+event_public_columns = (
+    Event.start_time,
+    Event.end_time,
+    Event.event_date,
+    Event.location,
+    Event.section_id,
+    Event.id,
+)
+section_public_columns = (Section.title, Section.sequence, Section.status, Section.id)
+schedule_public_columns = (
+    Schedule.url,
+    Schedule.title,
+    Schedule.venue,
+    Schedule.venue_url,
+    Schedule.schedule_datetime,
+    Schedule.locations,
+    Schedule.registration,
+    Schedule.description,
+    Schedule.id,
+)
+schedule_summary_columns = (
+    Schedule.url,
+    Schedule.title,
+    Schedule.venue,
+    Schedule.schedule_datetime,
+    Schedule.id,
+)
+venue_public_columns = (
+    Venue.name,
+    Venue.Tel,
+    Venue.Address,
+    Venue.Mail,
+    Venue.url,
+    Venue.Fax,
+    Venue.Contact,
+    Venue.id,
+)
+
+
+DEBUG = os.environ.get("DEBUG", "").lower() in ("1", "true")
+
+
+def loader_options(*options):
+    # in debug every relationship a query does not load explicitly raises on
+    # access, so a lazy load (and the N+1 it brings) shows up as an error
+    if DEBUG:
+        return [*options, raiseload("*")]
+    return list(options)
+
 
 sqlite_file_name = "database.db"
 sqlite_url = f"sqlite:///{sqlite_file_name}"
 
 
 connect_args = {"check_same_thread": False}
-engine = create_engine(sqlite_url, echo=True, connect_args=connect_args)
+
+
+def json_serializer(value) -> str:
+    return orjson.dumps(value).decode()
+
+
+# sync endpoints run on the anyio worker threadpool (40 threads by default),
+# so size the pool to let every worker thread hold a connection at once
+engine = create_engine(
+    sqlite_url,
+    echo=DEBUG,
+    connect_args=connect_args,
+    pool_size=20,
+    max_overflow=20,
+    pool_timeout=30,
+    # the JSON columns (Schedule.locations/registration) go through orjson
+    # instead of the stdlib json module
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
+)
+
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers run alongside a writer; with WAL, synchronous=NORMAL
+    # is still safe against corruption and only fsyncs at checkpoints
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
 
 
 def create_db_and_tables():
-    SQLModel.metadata.drop_all(engine)
-    SQLModel.metadata.create_all(engine)
+    # create_all only creates missing tables, but uvicorn workers start at the
+    # same moment and would race on the check; the lock lets the first worker
+    # create them while the others wait and then find them in place. flock is
+    # POSIX-only; elsewhere the DDL runs unlocked
+    with open(f"{sqlite_file_name}.lock", "w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        SQLModel.metadata.create_all(engine)
+        # create_all only adds indexes along with the tables it creates, so
+        # indexes added to a model later have to be created on their own
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(engine, checkfirst=True)
+
+
+# handlers return the instances they just committed; keeping their state
+# loaded avoids a SELECT per instance to refresh it after the commit. No
+# handler queries with pending changes, so autoflush is off as well
+SessionLocal = sessionmaker(
+    engine, class_=Session, autoflush=False, expire_on_commit=False
+)
 
 
 def get_session():
-    with Session(engine) as session:
+    with SessionLocal() as session:
         yield session
 
 
-app = FastAPI()
+def update_by_id(session: Session, model: type[SQLModel], row_id: int, data: dict):
+    # a single UPDATE ... RETURNING instead of loading the row, flushing the
+    # changes and reading it back; returns None when no row has that id
+    if not data:
+        return session.get(model, row_id)
+    statement = update(model).where(model.id == row_id).values(**data).returning(model)
+    return session.exec(statement).scalar_one_or_none()
+
 
+def delete_by_id(session: Session, model: type[SQLModel], row_id: int) -> bool:
+    # deletes go through the ORM so relationships are unlinked the same way
+    # for every model; returns False when no row has that id
+    row = session.get(model, row_id)
+    if not row:
+        return False
+    session.delete(row)
+    return True
 
-@app.on_event("startup")
-def on_startup():
-    create_db_and_tables()
+
+def orjson_default(value):
+    if isinstance(value, Url):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError
 
 
+# read_section and read_schedule build their nested public models with
+# model_construct straight from the loaded instance state and return this
+# response directly, skipping the response_model re-validation and
+# jsonable_encoder pass; it is also the app's default response class
+class AppJSONResponse(ORJSONResponse):
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def msgspec_enc_hook(value):
+    if isinstance(value, Url):
+        return str(value)
+    raise NotImplementedError
+
+
+msgspec_encoder = msgspec.json.Encoder(enc_hook=msgspec_enc_hook)
+
+
+# list endpoints build msgspec structs, which are far cheaper to create than
+# even model_construct'ed pydantic models, and encode them in one C pass
+class MsgspecJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return msgspec_encoder.encode(content)
+
+
+# bulk creates answer with the instances they just inserted; a cached adapter
+# per list type turns them into JSON bytes in a single pydantic-core call
+event_list_adapter = TypeAdapter(list[EventPublic])
+section_list_adapter = TypeAdapter(list[SectionPublic])
+schedule_list_adapter = TypeAdapter(list[SchedulePublic])
+venue_list_adapter = TypeAdapter(list[VenuePublic])
+
+
+def list_response(adapter: TypeAdapter, items: list) -> Response:
+    return Response(content=adapter.dump_json(items), media_type="application/json")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # waiting on the DDL lock must not block the event loop
+    await anyio.to_thread.run_sync(create_db_and_tables)
+    yield
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=AppJSONResponse)
+
+
+# request bodies have already been validated as *Create models, and table
+# model constructors do not validate, so the create endpoints build rows with
+# Model(**data) instead of running every validator again via model_validate
 @app.post("/events/", response_model=EventPublic)
 def create_event(*, session: Session = Depends(get_session), event: EventCreate):
-    db_event = Event.model_validate(event)
+    db_event = Event(**event.model_dump())
     session.add(db_event)
     session.commit()
-    session.refresh(db_event)
     return db_event
 
 
+@app.post("/events/bulk", response_model=list[EventPublic])
+def create_events(*, session: Session = Depends(get_session), events: list[EventCreate]):
+    # one transaction, and so one fsync, for the whole batch
+    db_events = [Event(**event.model_dump()) for event in events]
+    session.add_all(db_events)
+    session.commit()
+    return list_response(
+        event_list_adapter, [EventPublic.model_construct(**event.__dict__) for event in db_events]
+    )
+
+
 @app.get("/events/", response_model=list[EventPublic])
 def read_events(
     *,
@@ -215,53 +483,68 @@ def read_events(
     offset: int = 0,
     limit: int = Query(default=100, le=100),
 ):
-    eventes = session.exec(select(Event).offset(offset).limit(limit)).all()
-    return eventes
+    # plain column rows skip ORM instance construction and identity-map bookkeeping
+    statement = select(*event_public_columns)
+    eventes = session.exec(statement.offset(offset).limit(limit)).all()
+    return MsgspecJSONResponse([EventPublicStruct(**e._mapping) for e in eventes])
 
 
 @app.get("/events/{event_id}", response_model=EventPublicWithSection)
 def read_event(*, session: Session = Depends(get_session), event_id: int):
-    event = session.get(Event, event_id)
+    # primary key lookups go through Core: the row is only read, so the ORM's
+    # instance state and identity map would be pure overhead
+    event = session.exec(select(*event_public_columns).where(Event.id == event_id)).first()
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    return event
+    section = None
+    if event.section_id is not None:
+        statement = select(*section_public_columns).where(Section.id == event.section_id)
+        section = session.exec(statement).first()
+    return MsgspecJSONResponse(
+        EventPublicWithSectionStruct(
+            **event._mapping, section=SectionPublicStruct(**section._mapping) if section else None
+        )
+    )
 
 
 @app.patch("/events/{event_id}", response_model=EventPublic)
 def update_event(
     *, session: Session = Depends(get_session), event_id: int, event: EventUpdate
 ):
-    db_event = session.get(Event, event_id)
+    event_data = event.model_dump(exclude_unset=True)
+    db_event = update_by_id(session, Event, event_id, event_data)
     if not db_event:
         raise HTTPException(status_code=404, detail="Event not found")
-    event_data = event.model_dump(exclude_unset=True)
-    for key, value in event_data.items():
-        setattr(db_event, key, value)
-    session.add(db_event)
     session.commit()
-    session.refresh(db_event)
     return db_event
 
 
-@app.delete("/events/{event_id}")
+@app.delete("/events/{event_id}", status_code=204, response_class=Response)
 def delete_event(*, session: Session = Depends(get_session), event_id: int):
-    event = session.get(Event, event_id)
-    if not event:
+    if not delete_by_id(session, Event, event_id):
         raise HTTPException(status_code=404, detail="Event not found")
-    session.delete(event)
     session.commit()
-    return {"ok": True}
 
 
 @app.post("/sections/", response_model=SectionPublic)
 def create_section(*, session: Session = Depends(get_session), section: SectionCreate):
-    db_section = Section.model_validate(section)
+    db_section = Section(**section.model_dump())
     session.add(db_section)
     session.commit()
-    session.refresh(db_section)
     return db_section
 
 
+@app.post("/sections/bulk", response_model=list[SectionPublic])
+def create_sections(*, session: Session = Depends(get_session), sections: list[SectionCreate]):
+    # one transaction, and so one fsync, for the whole batch
+    db_sections = [Section(**section.model_dump()) for section in sections]
+    session.add_all(db_sections)
+    session.commit()
+    return list_response(
+        section_list_adapter, [SectionPublic.model_construct(**section.__dict__) for section in db_sections]
+    )
+
+
 @app.get("/sections/", response_model=list[SectionPublic])
 def read_sections(
     *,
@@ -269,16 +552,22 @@ def read_sections(
     offset: int = 0,
     limit: int = Query(default=100, le=100),
 ):
-    sections = session.exec(select(Section).offset(offset).limit(limit)).all()
-    return sections
+    statement = select(*section_public_columns)
+    sections = session.exec(statement.offset(offset).limit(limit)).all()
+    return MsgspecJSONResponse([SectionPublicStruct(**s._mapping) for s in sections])
 
 
 @app.get("/sections/{section_id}", response_model=SectionPublicWithEventes)
 def read_section(*, section_id: int, session: Session = Depends(get_session)):
-    section = session.get(Section, section_id)
+    section = session.get(Section, section_id, options=loader_options(selectinload(Section.events)))
     if not section:
         raise HTTPException(status_code=404, detail="Section not found")
-    return section
+    return AppJSONResponse(
+        SectionPublicWithEventes.model_construct(
+            **section.__dict__,
+            eventes=[EventPublic.model_construct(**e.__dict__) for e in section.events],
+        )
+    )
 
 
 @app.patch("/sections/{section_id}", response_model=SectionPublic)
@@ -288,54 +577,69 @@ def update_section(
     section_id: int,
     section: SectionUpdate,
 ):
-    db_section = session.get(Section, section_id)
+    section_data = section.model_dump(exclude_unset=True)
+    db_section = update_by_id(session, Section, section_id, section_data)
     if not db_section:
         raise HTTPException(status_code=404, detail="Section not found")
-    section_data = section.model_dump(exclude_unset=True)
-    for key, value in section_data.items():
-        setattr(db_section, key, value)
-    session.add(db_section)
     session.commit()
-    session.refresh(db_section)
     return db_section
 
 
-@app.delete("/sections/{section_id}")
+@app.delete("/sections/{section_id}", status_code=204, response_class=Response)
 def delete_section(*, session: Session = Depends(get_session), section_id: int):
-    section = session.get(Section, section_id)
-    if not section:
+    if not delete_by_id(session, Section, section_id):
         raise HTTPException(status_code=404, detail="Section not found")
-    session.delete(section)
     session.commit()
-    return {"ok": True}
 
 
 @app.post("/schedules/", response_model=SchedulePublic)
 def create_schedule(*, session: Session = Depends(get_session), schedule: ScheduleCreate):
-    db_schedule = Schedule.model_validate(schedule)
+    db_schedule = Schedule(**schedule.model_dump())
     session.add(db_schedule)
     session.commit()
-    session.refresh(db_schedule)
     return db_schedule
 
 
-@app.get("/schedules/", response_model=list[SchedulePublic])
+@app.post("/schedules/bulk", response_model=list[SchedulePublic])
+def create_schedules(*, session: Session = Depends(get_session), schedules: list[ScheduleCreate]):
+    # one transaction, and so one fsync, for the whole batch
+    db_schedules = [Schedule(**schedule.model_dump()) for schedule in schedules]
+    session.add_all(db_schedules)
+    session.commit()
+    return list_response(
+        schedule_list_adapter, [SchedulePublic.model_construct(**schedule.__dict__) for schedule in db_schedules]
+    )
+
+
+@app.get("/schedules/", response_model=list[SchedulePublic] | list[ScheduleSummary])
 def read_schedules(
     *,
     session: Session = Depends(get_session),
     offset: int = 0,
     limit: int = Query(default=100, le=100),
+    full: bool = True,
 ):
-    schedules = session.exec(select(Schedule).offset(offset).limit(limit)).all()
-    return schedules
+    if not full:
+        # summaries leave out the JSON and free-text columns entirely
+        statement = select(*schedule_summary_columns)
+        schedules = session.exec(statement.offset(offset).limit(limit)).all()
+        return MsgspecJSONResponse([ScheduleSummaryStruct(**s._mapping) for s in schedules])
+    statement = select(*schedule_public_columns)
+    schedules = session.exec(statement.offset(offset).limit(limit)).all()
+    return MsgspecJSONResponse([SchedulePublicStruct(**s._mapping) for s in schedules])
 
 
 @app.get("/schedules/{schedule_id}", response_model=SchedulePublicWithSections)
 def read_schedule(*, schedule_id: int, session: Session = Depends(get_session)):
-    schedule = session.get(Schedule, schedule_id)
+    schedule = session.get(Schedule, schedule_id, options=loader_options(selectinload(Schedule.sections)))
     if not schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    return schedule
+    return AppJSONResponse(
+        SchedulePublicWithSections.model_construct(
+            **schedule.__dict__
+            | {"sections": [SectionPublic.model_construct(**s.__dict__) for s in schedule.sections]}
+        )
+    )
 
 
 @app.patch("/schedules/{schedule_id}", response_model=SchedulePublic)
@@ -345,37 +649,40 @@ def update_schedule(
     schedule_id: int,
     schedule: ScheduleUpdate,
 ):
-    db_schedule = session.get(Schedule, schedule_id)
+    schedule_data = schedule.model_dump(exclude_unset=True)
+    db_schedule = update_by_id(session, Schedule, schedule_id, schedule_data)
     if not db_schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    schedule_data = schedule.model_dump(exclude_unset=True)
-    for key, value in schedule_data.items():
-        setattr(db_schedule, key, value)
-    session.add(db_schedule)
     session.commit()
-    session.refresh(db_schedule)
     return db_schedule
 
 
-@app.delete("/schedules/{schedule_id}")
+@app.delete("/schedules/{schedule_id}", status_code=204, response_class=Response)
 def delete_schedule(*, session: Session = Depends(get_session), schedule_id: int):
-    schedule = session.get(Schedule, schedule_id)
-    if not schedule:
+    if not delete_by_id(session, Schedule, schedule_id):
         raise HTTPException(status_code=404, detail="Schedule not found")
-    session.delete(schedule)
     session.commit()
-    return {"ok": True}
 
 
 @app.post("/venues/", response_model=VenuePublic)
 def create_venue(*, session: Session = Depends(get_session), venue: VenueCreate):
-    db_venue = Venue.model_validate(venue)
+    db_venue = Venue(**venue.model_dump())
     session.add(db_venue)
     session.commit()
-    session.refresh(db_venue)
     return db_venue
 
 
+@app.post("/venues/bulk", response_model=list[VenuePublic])
+def create_venues(*, session: Session = Depends(get_session), venues: list[VenueCreate]):
+    # one transaction, and so one fsync, for the whole batch
+    db_venues = [Venue(**venue.model_dump()) for venue in venues]
+    session.add_all(db_venues)
+    session.commit()
+    return list_response(
+        venue_list_adapter, [VenuePublic.model_construct(**venue.__dict__) for venue in db_venues]
+    )
+
+
 @app.get("/venues/", response_model=list[VenuePublic])
 def read_venues(
     *,
@@ -383,39 +690,33 @@ def read_venues(
     offset: int = 0,
     limit: int = Query(default=100, le=100),
 ):
-    venuees = session.exec(select(Venue).offset(offset).limit(limit)).all()
-    return venuees
+    statement = select(*venue_public_columns)
+    venuees = session.exec(statement.offset(offset).limit(limit)).all()
+    return MsgspecJSONResponse([VenuePublicStruct(**v._mapping) for v in venuees])
 
 
 @app.get("/venues/{venue_id}", response_model=VenuePublic)
 def read_venue(*, session: Session = Depends(get_session), venue_id: int):
-    venue = session.get(Venue, venue_id)
+    venue = session.exec(select(*venue_public_columns).where(Venue.id == venue_id)).first()
     if not venue:
         raise HTTPException(status_code=404, detail="Venue not found")
-    return venue
+    return MsgspecJSONResponse(VenuePublicStruct(**venue._mapping))
 
 
 @app.patch("/venues/{venue_id}", response_model=VenuePublic)
 def update_venue(
     *, session: Session = Depends(get_session), venue_id: int, venue: VenueUpdate
 ):
-    db_venue = session.get(Venue, venue_id)
+    venue_data = venue.model_dump(exclude_unset=True)
+    db_venue = update_by_id(session, Venue, venue_id, venue_data)
     if not db_venue:
         raise HTTPException(status_code=404, detail="Venue not found")
-    venue_data = venue.model_dump(exclude_unset=True)
-    for key, value in venue_data.items():
-        setattr(db_venue, key, value)
-    session.add(db_venue)
     session.commit()
-    session.refresh(db_venue)
     return db_venue
 
 
-@app.delete("/venues/{venue_id}")
+@app.delete("/venues/{venue_id}", status_code=204, response_class=Response)
 def delete_venue(*, session: Session = Depends(get_session), venue_id: int):
-    venue = session.get(Venue, venue_id)
-    if not venue:
+    if not delete_by_id(session, Venue, venue_id):
         raise HTTPException(status_code=404, detail="Venue not found")
-    session.delete(venue)
     session.commit()
-    return {"ok": True}
\ No newline at end of file